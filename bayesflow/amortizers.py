@@ -31,8 +31,8 @@ import tensorflow_probability as tfp
 from bayesflow.default_settings import DEFAULT_KEYS
 from bayesflow.exceptions import ConfigurationError, SummaryStatsError
 from bayesflow.helper_functions import check_tensor_sanity
-from bayesflow.losses import log_loss, mmd_summary_space, norm_diff
-from bayesflow.networks import EvidentialNetwork
+from bayesflow.losses import log_loss, log_loss_from_logits, mmd_summary_space, norm_diff
+from bayesflow.networks import EvidentialNetwork, PMPNetwork
 
 
 class AmortizedTarget(ABC):
@@ -913,7 +913,8 @@ class AmortizedModelComparison(tf.keras.Model):
         any `sumamry_conditions`, i.e., ``summary_conditions`` should be set to None, otherwise these will be ignored.
 
         - If no custom ``loss_fun`` is provided, the loss function will be the log loss for the means of a Dirichlet
-        distribution or softmax outputs.
+        distribution or softmax outputs. For a ``PMPNetwork`` with softmax outputs, the log loss is computed
+        directly from the logits.
         """
 
         super().__init__()
@@ -921,6 +922,11 @@ class AmortizedModelComparison(tf.keras.Model):
         self.inference_net = inference_net
         self.summary_net = summary_net
         self.loss = self._determine_loss(loss_fun)
+        self.loss_from_logits = (
+            loss_fun is None
+            and isinstance(self.inference_net, PMPNetwork)
+            and self.inference_net.output_activation is tf.nn.softmax
+        )
         self.num_models = self.inference_net.num_models
 
     def call(self, input_dict, return_summary=False, **kwargs):
@@ -1002,6 +1008,16 @@ class AmortizedModelComparison(tf.keras.Model):
         loss  : tf.Tensor of shape (1,) - the total computed loss given input variables
         """
 
+        # Use fused softmax cross-entropy on the logits, if possible
+        if self.loss_from_logits:
+            _, full_cond = self._compute_summary_condition(
+                input_dict.get(DEFAULT_KEYS["summary_conditions"]),
+                input_dict.get(DEFAULT_KEYS["direct_conditions"]),
+                **kwargs,
+            )
+            logits = self.inference_net.logits(full_cond, **kwargs)
+            return log_loss_from_logits(input_dict[DEFAULT_KEYS["model_indices"]], logits)
+
         preds = self(input_dict, **kwargs)
         loss = self.loss(input_dict[DEFAULT_KEYS["model_indices"]], preds)
         return loss
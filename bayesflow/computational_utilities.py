@@ -284,14 +284,17 @@ def expected_calibration_error(m_true, m_pred, num_bins=10):
     probs_true = []
     probs_pred = []
 
+    # True model labels and bin edges are shared across all models
+    true_idx = m_true.argmax(axis=1)
+    bins = np.linspace(0.0, 1.0, num_bins + 1)
+
     # Loop for each model and compute calibration errs per bin
     for k in range(n_models):
-        y_true = (m_true.argmax(axis=1) == k).astype(np.float32)
+        y_true = (true_idx == k).astype(np.float32)
         y_prob = m_pred[:, k]
         prob_true, prob_pred = calibration_curve(y_true, y_prob, n_bins=num_bins)
 
         # Compute ECE by weighting bin errors by bin size
-        bins = np.linspace(0.0, 1.0, num_bins + 1)
         binids = np.searchsorted(bins[1:-1], y_prob)
         bin_total = np.bincount(binids, minlength=len(bins))
         nonzero = bin_total != 0
@@ -303,6 +306,12 @@ def expected_calibration_error(m_true, m_pred, num_bins=10):
     return cal_errs, probs_true, probs_pred
 
 
+MMD_KERNELS = {
+    "gaussian": gaussian_kernel_matrix,
+    "inverse_multiquadratic": inverse_multiquadratic_kernel_matrix,
+}
+
+
 def maximum_mean_discrepancy(source_samples, target_samples, kernel="gaussian", mmd_weight=1.0, minimum=0.0):
     """Computes the MMD given a particular choice of kernel.
 
@@ -329,12 +338,7 @@ def maximum_mean_discrepancy(source_samples, target_samples, kernel="gaussian",
     """
 
     # Determine kernel, fall back to Gaussian if unknown string passed
-    if kernel == "gaussian":
-        kernel_fun = gaussian_kernel_matrix
-    elif kernel == "inverse_multiquadratic":
-        kernel_fun = inverse_multiquadratic_kernel_matrix
-    else:
-        kernel_fun = gaussian_kernel_matrix
+    kernel_fun = MMD_KERNELS.get(kernel, gaussian_kernel_matrix)
 
     # Compute and return MMD value
     loss_value = mmd_kernel(source_samples, target_samples, kernel=kernel_fun)
@@ -55,7 +55,9 @@ class DefaultLikelihoodConfigurator:
         input_dict = self._combine(forward_dict)
 
         # Convert everything to default type or fail gently
-        input_dict = {k: v.astype(self.default_float_type) if v is not None else v for k, v in input_dict.items()}
+        input_dict = {
+            k: v.astype(self.default_float_type, copy=False) if v is not None else v for k, v in input_dict.items()
+        }
         return input_dict
 
     def _combine(self, forward_dict):
@@ -228,7 +230,9 @@ class DefaultPosteriorConfigurator:
         input_dict[DEFAULT_KEYS["parameters"]] = forward_dict[DEFAULT_KEYS["prior_draws"]]
 
         # Convert everything to default type or fail gently
-        input_dict = {k: v.astype(self.default_float_type) if v is not None else v for k, v in input_dict.items()}
+        input_dict = {
+            k: v.astype(self.default_float_type, copy=False) if v is not None else v for k, v in input_dict.items()
+        }
         return input_dict
 
 
@@ -289,5 +293,7 @@ class DefaultModelComparisonConfigurator:
         input_dict[DEFAULT_KEYS["model_indices"]] = np.concatenate(model_indices)
 
         # Convert to default types
-        input_dict = {k: v.astype(self.default_float_type) if v is not None else v for k, v in input_dict.items()}
+        input_dict = {
+            k: v.astype(self.default_float_type, copy=False) if v is not None else v for k, v in input_dict.items()
+        }
         return input_dict
@@ -344,10 +344,10 @@ class SplineCoupling(tf.keras.Model):
         # Determine which targets are in domain and which are not
         if not inverse:
             target_in_domain = tf.logical_and(knots_x[..., 0] < target, target <= knots_x[..., -1])
-            higher_indices = tf.searchsorted(knots_x, target[..., None])
+            higher_indices = tf.searchsorted(knots_x, target[..., None], out_type=tf.int32)
         else:
             target_in_domain = tf.logical_and(knots_y[..., 0] < target, target <= knots_y[..., -1])
-            higher_indices = tf.searchsorted(knots_y, target[..., None])
+            higher_indices = tf.searchsorted(knots_y, target[..., None], out_type=tf.int32)
         target_in = target[target_in_domain]
         target_in_idx = tf.where(target_in_domain)
         target_out = target[~target_in_domain]
@@ -357,7 +357,6 @@ class SplineCoupling(tf.keras.Model):
         if tf.size(target_in_idx) > 0:
             # Index crunching
             higher_indices = tf.gather_nd(higher_indices, target_in_idx)
-            higher_indices = tf.cast(higher_indices, tf.int32)
             lower_indices = higher_indices - 1
             lower_idx_tuples = tf.concat([tf.cast(target_in_idx, tf.int32), lower_indices], axis=-1)
             higher_idx_tuples = tf.concat([tf.cast(target_in_idx, tf.int32), higher_indices], axis=-1)
@@ -629,25 +628,26 @@ class CouplingLayer(tf.keras.Model):
             The transformed input and the corresponding Jacobian of the transformation.
         """
 
-        # Initialize log_det_Js accumulator
-        log_det_Js = tf.zeros(1)
+        # Collect log_det_Js of optional layers, added to the coupling log_det_J below
+        log_det_Js = []
 
         # Normalize activation, if specified
         if self.act_norm is not None:
             target, log_det_J_act = self.act_norm(target)
-            log_det_Js += log_det_J_act
+            log_det_Js.append(log_det_J_act)
 
         # Permute, if indicated
         if self.permutation is not None:
             target = self.permutation(target)
         if self.permutation.trainable:
             target, log_det_J_p = target
-            log_det_Js += log_det_J_p
+            log_det_Js.append(log_det_J_p)
 
         # Pass through coupling layer
         latent, log_det_J_c = self._forward(target, condition, **kwargs)
-        log_det_Js += log_det_J_c
-        return latent, log_det_Js
+        for log_det_J in log_det_Js:
+            log_det_J_c += log_det_J
+        return latent, log_det_J_c
 
     def inverse(self, latent, condition, **kwargs):
         """Performs an inverse pass through a coupling layer with an optinal `Permutation` and `ActNorm` layers.
@@ -67,6 +67,7 @@ class SimulationDataset:
         self.data = tf.data.Dataset.from_tensor_slices(tuple(slices)).shuffle(buffer_size).batch(batch_size)
         self.keys_used = keys_used
         self.keys_none = keys_none
+        self._none_dict = dict.fromkeys(keys_none)
         self.n_sim = n_sim
         self.num_batches = len(self.data)
 
@@ -88,11 +89,8 @@ class SimulationDataset:
     def __call__(self, batch_in):
         """Convert output of tensorflow.data.Dataset to dict."""
 
-        forward_dict = {}
-        for key_used, batch_stuff in zip(self.keys_used, batch_in):
-            forward_dict[key_used] = batch_stuff.numpy()
-        for key_none in zip(self.keys_none):
-            forward_dict[key_none] = None
+        forward_dict = dict(zip(self.keys_used, [batch_stuff.numpy() for batch_stuff in batch_in]))
+        forward_dict.update(self._none_dict)
         return forward_dict
 
     def __len__(self):
@@ -112,10 +112,10 @@ class DenseCouplingNet(tf.keras.Model):
 
         # Handle 3D case for a set-flow and repeat condition over
         # the second `time` or `n_observations` axis of `target``
-        if len(tf.shape(target)) == 3 and len(tf.shape(condition)) == 2:
-            shape = tf.shape(target)
+        # Ranks are read from the static shapes to avoid creating shape ops on every call
+        if len(target.shape) == 3 and len(condition.shape) == 2:
             condition = tf.expand_dims(condition, 1)
-            condition = tf.tile(condition, [1, shape[1], 1])
+            condition = tf.tile(condition, [1, tf.shape(target)[1], 1])
         inp = tf.concat((target, condition), axis=-1)
         out = self.fc(inp, **kwargs)
 
@@ -521,14 +521,11 @@ class EquivariantModule(tf.keras.Model):
             Output of shape (batch_size, ..., equiv_dim)
         """
 
-        # Store shape of x, will be (batch_size, ..., some_dim)
-        shape = tf.shape(x)
-
         # Example: Output dim is (batch_size, inv_dim) - > (batch_size, N, inv_dim)
         out_inv = self.invariant_module(x, **kwargs)
         out_inv = tf.expand_dims(out_inv, -2)
-        tiler = [1] * len(shape)
-        tiler[-2] = shape[-2]
+        tiler = [1] * len(x.shape)
+        tiler[-2] = tf.shape(x)[-2]
         out_inv_rep = tf.tile(out_inv, tiler)
 
         # Concatenate each x with the repeated invariant embedding
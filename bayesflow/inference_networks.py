@@ -198,7 +198,7 @@ class InvertibleNetwork(tf.keras.Model):
                 noise_scale = tf.random.uniform(shape=shape_scale, minval=self.soft_low, maxval=self.soft_high)
             # Case inference mode
             else:
-                noise_scale = tf.zeros(shape=shape_scale) + self.soft_low
+                noise_scale = tf.fill(shape_scale, float(self.soft_low))
 
             # Perturb data with noise (will broadcast to all dimensions)
             if len(shape_scale) == 2 and len(target_shape) == 3:
@@ -230,7 +230,7 @@ class InvertibleNetwork(tf.keras.Model):
             shape_scale = (
                 (condition.shape[0], 1) if len(condition.shape) == 2 else (condition.shape[0], condition.shape[1], 1)
             )
-            noise_scale = tf.zeros(shape=shape_scale) + 2.0 * self.soft_low
+            noise_scale = tf.fill(shape_scale, 2.0 * self.soft_low)
 
             # Augment condition with noise scale variate
             condition = tf.concat((condition, noise_scale), axis=-1)
@@ -171,8 +171,7 @@ def log_loss(model_indices, preds, evidential=False, label_smoothing=0.01):
     # Apply label smoothing to indices, if specified
     if label_smoothing is not None:
         num_models = tf.cast(tf.shape(model_indices)[1], dtype=tf.float32)
-        model_indices *= 1.0 - label_smoothing
-        model_indices += label_smoothing / num_models
+        model_indices = model_indices * (1.0 - label_smoothing) + label_smoothing / num_models
 
     # Obtain probs if using an evidential network
     if evidential:
@@ -186,6 +185,35 @@ def log_loss(model_indices, preds, evidential=False, label_smoothing=0.01):
     return loss
 
 
+def log_loss_from_logits(model_indices, logits, label_smoothing=0.01):
+    """Computes the same logarithmic loss as ``log_loss`` for a non-evidential network,
+    but directly from unnormalized ``logits`` using TensorFlow's fused softmax cross-entropy
+    kernel, which avoids materializing and clipping the intermediate probabilities.
+
+    Parameters
+    ----------
+    model_indices   : tf.Tensor of shape (batch_size, num_models)
+        one-hot-encoded true model indices
+    logits          : tf.Tensor of shape (batch_size, num_models)
+        The unnormalized (pre-softmax) network outputs.
+    label_smoothing : float or None, optional, default: 0.01
+        Optional label smoothing factor.
+
+    Returns
+    -------
+    loss : tf.Tensor
+        A single scalar Monte-Carlo approximation of the log-loss, shape (,)
+    """
+
+    # Apply label smoothing to indices, if specified
+    if label_smoothing is not None:
+        num_models = tf.cast(tf.shape(model_indices)[1], dtype=tf.float32)
+        model_indices = model_indices * (1.0 - label_smoothing) + label_smoothing / num_models
+
+    loss = tf.reduce_mean(tf.nn.softmax_cross_entropy_with_logits(labels=model_indices, logits=logits))
+    return loss
+
+
 def norm_diff(tensor_a, tensor_b, axis=None, ord='euclidean'):
     """
     Wrapper around tf.norm that computes the norm of the difference between two tensors along the specified axis.
@@ -1021,6 +1021,7 @@ class Trainer:
                 # Simulate initial data
                 logger.info(f"Simulating initial {sim_per_round} data sets for training...")
                 simulations_dict = self._forward_inference(sim_per_round, configure=False, **kwargs)
+                buffers = self._allocate_round_buffers(simulations_dict, sim_per_round, rounds)
                 first_round = False
             else:
                 # Simulate further data
@@ -1028,9 +1029,13 @@ class Trainer:
                 logger.info(f"New total number of simulated data sets for training: {sim_per_round * r}")
                 simulations_dict_r = self._forward_inference(sim_per_round, configure=False, **kwargs)
 
-                # Attempt to concatenate data sets
+                # Attempt to append data sets, writing into the preallocated buffers where available
+                start, stop = sim_per_round * (r - 1), sim_per_round * r
                 for k in simulations_dict.keys():
-                    if simulations_dict[k] is not None:
+                    if k in buffers:
+                        buffers[k][start:stop] = simulations_dict_r[k]
+                        simulations_dict[k] = buffers[k][:stop]
+                    elif simulations_dict[k] is not None:
                         simulations_dict[k] = np.concatenate((simulations_dict[k], simulations_dict_r[k]), axis=0)
 
             # Train offline with generated stuff
@@ -1166,6 +1171,21 @@ class Trainer:
         else:
             self.optimizer = optimizer
 
+    def _allocate_round_buffers(self, simulations_dict, sim_per_round, rounds):
+        """Helper method to preallocate arrays holding the simulations of all rounds, so that each
+        round is copied once instead of re-concatenating all previous rounds. Only entries that are arrays
+        batched over the first axis get a buffer, all other entries are concatenated as usual."""
+
+        buffers = {}
+        if rounds < 2:
+            return buffers
+        for k, v in simulations_dict.items():
+            if isinstance(v, np.ndarray) and v.ndim > 0 and v.shape[0] == sim_per_round:
+                buffers[k] = np.empty((sim_per_round * rounds,) + v.shape[1:], dtype=v.dtype)
+                buffers[k][:sim_per_round] = v
+                simulations_dict[k] = buffers[k][:sim_per_round]
+        return buffers
+
     def _save_trainer(self, save_checkpoint):
         """Helper method to take care of IO operations."""
 
@@ -21,9 +21,15 @@
 import numpy as np
 import pytest
 
-from bayesflow.amortizers import AmortizedLikelihood, AmortizedPosterior, AmortizedPosteriorLikelihood
+from bayesflow.amortizers import (
+    AmortizedLikelihood,
+    AmortizedModelComparison,
+    AmortizedPosterior,
+    AmortizedPosteriorLikelihood,
+)
 from bayesflow.default_settings import DEFAULT_KEYS
-from bayesflow.networks import InvariantNetwork, InvertibleNetwork
+from bayesflow.losses import log_loss
+from bayesflow.networks import InvariantNetwork, InvertibleNetwork, PMPNetwork
 
 
 @pytest.mark.parametrize("cond_shape", ["2d", "3d"])
@@ -274,3 +280,26 @@ def test_joint_amortizer(data_dim, params_dim):
         assert l_samples.shape[1] == n_samples_l
         assert p_samples.shape[2] == params_dim
         assert l_samples.shape[2] == data_dim
+
+
+@pytest.mark.parametrize("num_models", [2, 5])
+def test_amortized_model_comparison_logits_loss(num_models):
+    """Tests that the logits-based loss of the ``AmortizedModelComparison`` matches the log loss on PMPs."""
+
+    # Randomize input
+    batch_size = np.random.randint(low=2, high=32)
+    cond_dim = np.random.randint(low=2, high=32)
+
+    # Create amortizer instance
+    amortizer = AmortizedModelComparison(PMPNetwork(num_models, dropout=False))
+    assert amortizer.loss_from_logits
+
+    # Prepare input
+    condition = np.random.normal(size=(batch_size, cond_dim)).astype(np.float32)
+    model_indices = np.eye(num_models, dtype=np.float32)[np.random.randint(num_models, size=batch_size)]
+    inp_dict = {DEFAULT_KEYS["direct_conditions"]: condition, DEFAULT_KEYS["model_indices"]: model_indices}
+
+    # Compare against log loss on post-activation outputs
+    loss = amortizer.compute_loss(inp_dict).numpy()
+    expected = log_loss(model_indices, amortizer.posterior_probs(inp_dict)).numpy()
+    assert np.allclose(loss, expected, atol=1e-5)
@@ -135,3 +135,11 @@ def test_c2st_params(n_folds, scoring, normalize, seed, hidden_units_per_dim):
         seed=seed,
         hidden_units_per_dim=hidden_units_per_dim
     )
+
+
+@pytest.mark.parametrize("num_models", [2, 4])
+def test_expected_calibration_error(num_models):
+    m_true = np.eye(num_models)[np.random.randint(num_models, size=50)]
+    cal_errs, probs_true, probs_pred = computational_utilities.expected_calibration_error(m_true, m_true)
+    assert len(cal_errs) == len(probs_true) == len(probs_pred) == num_models
+    assert np.allclose(cal_errs, 0.0)